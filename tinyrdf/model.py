@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Sequence, Set
-from typing import Final, Iterable, Iterator, Mapping, NamedTuple, cast
+import gc
+from collections.abc import Callable, Sequence, Set
+from contextlib import contextmanager, nullcontext
+from itertools import count
+from types import MappingProxyType
+from typing import (ClassVar, Final, Iterable, Iterator, Mapping, NamedTuple,
+                    cast)
 
 from .terms import (IRI, RDF_FIRST, RDF_NIL, RDF_REIFIES, RDF_REST, RDF_TYPE,
                     BNode, Dataset, Graph, Literal, Quad, Subject, Term, Triple)
@@ -11,46 +16,103 @@ class ModelSpace:
     default: Model
     named: Mapping[Subject, Model]
 
+    _terms: dict[Term, Term]
     _bnode_prefix: str
-    _bnode_counter: int = 0
+    _bnode_ids: Iterator[str]
 
     def __init__(self, default: Model | None = None, bnode_prefix: str | None = None):
+        self._terms = {
+            term: term for term in (RDF_FIRST, RDF_NIL, RDF_REST, RDF_TYPE, RDF_REIFIES)
+        }
+
         self.default = default if default is not None else self._new_model()
         self.named = {}
 
         self._bnode_prefix = (
             f"b-{hex(id(self))[2:]}-" if bnode_prefix is None else bnode_prefix
         )
-        self._bnode_counter = 0
+        self._bnode_ids = map(self._bnode_prefix.__add__, map(str, count(1)))
 
     def _new_model(self) -> Model:
         return Model(self)
 
     def _new_bnode_id(self) -> str:
-        self._bnode_counter += 1
-        return f"{self._bnode_prefix}{self._bnode_counter}"
+        return next(self._bnode_ids)
 
     def new_bnode(self, bnode_id: str | None = None) -> BNode:
         return BNode(bnode_id or self._new_bnode_id())
 
-    def decode(self, datastream: Iterable[Triple | Quad]) -> int:
+    def intern(self, term: Term) -> Term:
+        # Terms are plain tuples when compared, so e.g. IRI('x') == BNode('x').
+        # Triple terms are not pooled, since that holds for their parts too.
+        if isinstance(term, Triple):
+            return term
+
+        pooled = self._terms.setdefault(term, term)
+        return pooled if type(pooled) is type(term) else term
+
+    def decode(
+        self, datastream: Iterable[Triple | Quad], pause_gc: bool = False
+    ) -> int:
+        default = self.default
+        named = cast(dict[Subject, Model], self.named)
+        new_model = self._new_model
+
+        model = default
+        last_g: Subject | None = None
+        resources, add = model._resources, model.add
+
+        # Consecutive statements commonly share their subject term.
+        last_s: Subject | None = None
+        subj: Described
+
         i = 0
-        for datum in datastream:
-            if isinstance(datum, Triple):
-                s, p, o = datum
-                model = self.default
-            else:
-                s, p, o, g = datum
-                if g not in self.named:
-                    assert isinstance(self.named, dict)
-                    self.named[g] = self._new_model()
-                model = self.named[g]
+        with _gc_paused() if pause_gc else nullcontext():
+            for datum in datastream:
+                if len(datum) == 3:
+                    s, p, o = datum
+                    if model is not default:
+                        model = default
+                        last_g = last_s = None
+                        resources, add = model._resources, model.add
+                else:
+                    s, p, o, g = datum
+                    if model is default or g != last_g:
+                        graph = named.get(g)
+                        if graph is None:
+                            graph = named[g] = new_model()
+                        model = graph
+                        last_g = g
+                        last_s = None
+                        resources, add = model._resources, model.add
+
+                if s is not last_s:
+                    subj = resources[s]  # type: ignore[assignment]
+                    last_s = s
+
+                if add(subj, p, resources[o]):
+                    i += 1
 
-            subj = model.about(s)
-            obj = model.get(o)
+        return i
 
-            if model.add(subj, p, obj):
-                i += 1
+    def decode_triples(
+        self, triples: Iterable[Triple], pause_gc: bool = False
+    ) -> int:
+        model = self.default
+        resources, add = model._resources, model.add
+
+        last_s: Subject | None = None
+        subj: Described
+
+        i = 0
+        with _gc_paused() if pause_gc else nullcontext():
+            for s, p, o in triples:
+                if s is not last_s:
+                    subj = resources[s]  # type: ignore[assignment]
+                    last_s = s
+
+                if add(subj, p, resources[o]):
+                    i += 1
 
         return i
 
@@ -59,9 +121,8 @@ class ModelSpace:
             yield fact.term
 
         for name, model in self.named.items():
-            for triple in model.get_facts():
-                s, p, o = triple.term
-                yield Quad(s, p, o, name)
+            for fact in model.get_facts():
+                yield Quad(*fact.term, name)
 
     def __iter__(self) -> Iterator[Triple | Quad]:
         return self.encode()
@@ -71,160 +132,251 @@ class Model:
     space: ModelSpace
 
     _resources: dict[Term, Resource]
+    _described: dict[Subject, Described]
+    _predicates: dict[IRI, Referent]
+    _facts: tuple[Proposition, ...] | None
+    _frozen: bool
 
     def __init__(self, space: ModelSpace | None = None):
         self.space = space or self._new_space()
-        self._resources = {}
+        self._resources = _Resources(self._new_resource)
+        self._described = {}
+        self._predicates = {}
+        self._facts = None
+        self._frozen = False
 
     def _new_space(self) -> ModelSpace:
         return ModelSpace(self)
 
     def _new_resource(self, term: Term) -> Resource:
-        match term:
-            case IRI(_):
-                return Referent(self, term)
-            case BNode(_):
-                return Something(self, term)
-            case Literal(_):
-                return Value(self, term)
-            case Triple(_):
-                return Proposition(self, cast(Triple, term))
+        term = self.space.intern(term)
+        resource_type = _RESOURCE_BY_TYPE.get(type(term))
+        if resource_type is None:
+            resource_type = _find_by_type(_RESOURCE_BY_TYPE, term)
+        return resource_type(self, term)
 
     def get(self, term: Term) -> Resource:
-        resource = self._resources.get(term)
-        if resource is None:
-            resource = self._new_resource(term)
-            self._resources[term] = resource
-
-        return resource
+        return self._resources[term]
 
     def about(self, s: Subject) -> Described:
-        return cast(Described, self.get(s))
+        return self._resources[s]  # type: ignore[return-value]
 
     def something(self) -> Something:
         return cast(Something, self.get(self.space.new_bnode()))
 
-    def _get_proposition(self, s: Subject, p: IRI, o: Term):
-        return cast(Proposition, self.get(Triple(s, p, o)))
+    def _get_proposition(self, s: Subject, p: IRI, o: Term) -> Proposition:
+        triple = _new_tuple(Triple, (s, p, o))
+        # Only reached for edges not yet in the spo index, so the proposition
+        # is usually new and creating it upfront saves a second hash probe.
+        return self._resources.setdefault(  # type: ignore[return-value]
+            triple, Proposition(self, triple)
+        )
 
     def add(self, subj: Described, pred: IRI, obj: Resource) -> bool:
-        if pred not in subj._description:
-            subj._description[pred] = set()
+        if self._frozen:
+            raise TypeError("Cannot add to a frozen model")
 
-        propositions = subj._description[pred]
-        proposition = self._get_proposition(subj.term, pred, obj.term)
+        description = subj._description
+        if description is _NO_INDEX:
+            description = subj._description = {}
 
-        if proposition in propositions:
+        propositions = description.setdefault(pred, {})
+
+        if obj in propositions:
             return False
 
-        propositions.add(proposition)
+        prop: Referent = self._resources[pred]  # type: ignore[assignment]
 
-        prop = cast(Referent, self.about(pred))
-        prop._predicate_of.add(proposition)
+        proposition = self._get_proposition(subj.term, prop.term, obj.term)
+        propositions[obj] = proposition
 
-        if pred not in obj._object_of:
-            reverse_subjects = obj._object_of[pred] = set()
-        else:
-            reverse_subjects = obj._object_of[pred]
+        predicate_of = prop._predicate_of
+        if predicate_of is _NO_INDEX:
+            predicate_of = prop._predicate_of = {}
+            self._predicates[prop.term] = prop
+
+        predicate_of[proposition] = None
+
+        proposition._subject = subj
+        proposition._predicate = prop
+        proposition._object = obj
 
-        reverse_subjects.add(proposition)
+        if obj._track_object_of or prop._values_indexed:
+            object_of = obj._object_of
+            if object_of is _NO_INDEX:
+                object_of = obj._object_of = {}
+
+            object_of.setdefault(pred, {})[subj] = proposition
+
+        self._facts = None
 
         return True
 
     def remove(self, subj: Described, pred: IRI, obj: Resource) -> bool:
-        if pred not in subj._description:
-            return False
+        if self._frozen:
+            raise TypeError("Cannot remove from a frozen model")
 
-        propositions = subj._description[pred]
+        propositions = subj._description.get(pred)
+        if propositions is None:
+            return False
 
-        proposition = self._get_proposition(subj.term, pred, obj.term)
+        proposition = propositions.pop(obj, None)
 
-        if proposition not in propositions:
+        if proposition is None:
             return False
 
         #forget = True
 
-        propositions.remove(proposition)
         #if forget:
         #    del self._resources[proposition.term]
 
         if len(propositions) == 0:
             del subj._description[pred]
+            if len(subj._description) == 0:
+                subj._description = _NO_INDEX
 
         #if forget and len(subj._description) == 0:
         #    del self._resources[subj.term]
 
-        prop = cast(Referent, self.about(pred))
-        prop._predicate_of.remove(proposition)
+        prop: Referent = self._resources[pred]  # type: ignore[assignment]
+        del prop._predicate_of[proposition]
+        if len(prop._predicate_of) == 0:
+            prop._predicate_of = _NO_INDEX
+            del self._predicates[prop.term]
 
         #if forget and len(prop._predicate_of) == 0:
         #    del self._resources[prop.term]
 
         subjs = obj._object_of.get(pred)
         if subjs is not None:
-            subjs.remove(proposition)
+            del subjs[subj]
             if len(subjs) == 0:
                 del obj._object_of[pred]
+                if len(obj._object_of) == 0:
+                    obj._object_of = _NO_INDEX
             #if forget and len(obj._object_of) == 0:
             #    del self._resources[obj.term]
 
+        self._facts = None
+
         return True
 
     def get_resources(self) -> Iterator[Resource]:
         return iter(self._resources.values())
 
     def get_subjects(self) -> Iterator[Described]:
-        for resource in self.get_resources():
-            if isinstance(resource, Described):
-                if len(resource._description):
-                    yield resource
+        for resource in self._described.values():
+            if len(resource._description):
+                yield resource
 
     def get_predicates(self) -> Iterator[Referent]:
-        for resource in self.get_resources():
-            if isinstance(resource, Referent):
-                if len(resource._predicate_of):
-                    yield resource
+        return iter(self._predicates.values())
 
     def get_objects(self) -> Iterator[Resource]:
+        untracked: set[Resource] | None = None
         for resource in self.get_resources():
-            if len(resource._object_of):
-                yield resource
+            if resource._track_object_of:
+                if len(resource._object_of):
+                    yield resource
+            else:
+                if untracked is None:
+                    untracked = {
+                        fact.object
+                        for fact in self.get_facts()
+                        if not fact.object._track_object_of
+                    }
+                if resource in untracked:
+                    yield resource
+
+    def get_facts(self, predicate: IRI | None = None) -> Iterator[Proposition]:
+        if predicate is not None:
+            prop = self._resources.get(predicate)
+            if not isinstance(prop, Referent):
+                return iter(_EMPTY)
+
+            if self._frozen:
+                return iter(prop._predicate_of)
+
+            # A snapshot, like the unfiltered facts, so that the model can be
+            # changed while iterating.
+            return iter(tuple(prop._predicate_of))
+
+        facts = self._facts
+        if facts is None:
+            facts = self._facts = tuple(self._iter_facts())
 
-    def get_facts(self) -> Iterator[Proposition]:
-        for resource in self.get_subjects():
-            yield from resource.get_facts()
+        return iter(facts)
+
+    def _iter_facts(self) -> Iterator[Proposition]:
+        for resource in self._described.values():
+            for propositions in resource._description.values():
+                yield from propositions.values()
+
+    def freeze(self) -> None:
+        # Once frozen, the indexes and the flat sequence of facts cannot go
+        # stale, so scans can use them directly without taking snapshots.
+        if self._facts is None:
+            self._facts = tuple(self._iter_facts())
+        self._frozen = True
+
+    def is_frozen(self) -> bool:
+        return self._frozen
+
+
+# Builds NamedTuple terms without going through their Python-level __new__.
+_new_tuple: Final = tuple.__new__
+
+# Shared by all resources until they get their first index entry.
+_NO_INDEX: Final = cast(dict, MappingProxyType({}))
+_EMPTY: Final[frozenset] = frozenset()
+
+
+class _Resources(dict[Term, "Resource"]):
+    __slots__ = ('_new_resource',)
+
+    def __init__(self, new_resource: Callable[[Term], Resource]):
+        super().__init__()
+        self._new_resource = new_resource
+
+    def __missing__(self, term: Term) -> Resource:
+        resource = self._new_resource(term)
+        self[resource.term] = resource
+        return resource
 
 
 class Resource:
+    __slots__ = ('model', 'term', '_object_of')
+
     model: Model
     term: Term
 
-    _object_of: dict[IRI, set[Proposition]]  # ops index
+    _object_of: dict[IRI, dict[Described, Proposition]]  # ops index
+    _track_object_of: ClassVar[bool] = True
 
     def __init__(self, model, term: Term):
         self.model = model
         self.term = term
-        self._object_of = dict()
-
-    def __hash__(self):
-        return hash(self.term)
+        self._object_of = _NO_INDEX
 
     def __lt__(self, other: object) -> int:
         if isinstance(other, Resource):
-            if type(self.term) == type(other.term):
+            if type(self.term) is type(other.term):
                 return self.term < other.term
 
-            return _get_order_of(self.term) < _get_order_of(other.term)
+            try:
+                return _ORDER_BY_TYPE[type(self.term)] < _ORDER_BY_TYPE[type(other.term)]
+            except KeyError:
+                return (
+                    _find_by_type(_ORDER_BY_TYPE, self.term)
+                    < _find_by_type(_ORDER_BY_TYPE, other.term)
+                )
 
         raise TypeError(
             f"'<' not supported between instances of {type(self)!r} and {type(other)!r}"
         )
 
     def get_subjects(self, predicate: IRI) -> Iterator[Described]:
-        if predicate not in self._object_of:
-            return
-        for proposition in self._object_of[predicate]:
-            yield proposition._subject
+        return iter(self._object_of.get(predicate, _EMPTY))
 
     def _deref(self, obj: Resource | Term) -> Resource:
         return (
@@ -235,39 +387,42 @@ class Resource:
 
 
 class Described(Resource):
+    __slots__ = ('_description',)
+
     term: Subject
 
-    _description: dict[IRI, set[Proposition]]  # spo index
+    _description: dict[IRI, dict[Resource, Proposition]]  # spo index
 
     def __init__(self, model: Model, term: Subject):
         super().__init__(model, term)
-        self._description = dict()
+        self._description = _NO_INDEX
+        model._described[term] = self
 
     def get_predicates(self) -> Iterator[Referent]:
         for pred in self._description:
-            yield cast(Referent, self.model.get(pred))
+            yield self.model._resources[pred]  # type: ignore[misc]
 
     def get_objects(self, predicate: IRI) -> Iterator[Resource]:
-        for proposition in self.get_facts(predicate):
-            yield proposition._object
+        return iter(self._description.get(predicate, _EMPTY))
 
     def get_facts(self, predicate: IRI | None = None) -> Iterator[Proposition]:
         if predicate is None:
             for pred, propositions in self._description.items():
-                yield from propositions
-        elif predicate in self._description:
-            yield from self._description[predicate]
+                yield from propositions.values()
+        else:
+            yield from self._description.get(predicate, _NO_INDEX).values()
 
     def add(self, pred: IRI, obj: Resource | Term) -> None:
         self.model.add(self, pred, self._deref(obj))
 
     def has(self, pred: IRI, obj: Resource | Term) -> bool:
-        if pred in self._description:
-            o = obj.term if isinstance(obj, Resource) else obj
-            return Triple(self.term, pred, o) in self.model._resources
-        else:
+        propositions = self._description.get(pred)
+        if propositions is None:
             return False
 
+        o = obj if isinstance(obj, Resource) else self.model._resources.get(obj)
+        return o is not None and o in propositions
+
     def remove(self, pred: IRI, obj: Resource | Term) -> None:
         self.model.remove(self, pred, self._deref(obj))
 
@@ -288,86 +443,136 @@ class Described(Resource):
 
 
 class Something(Described):
+    __slots__ = ()
+
     term: BNode
 
     def as_list(self) -> Sequence | None:
         items = []
-        for first in self.get_objects(RDF_FIRST):
+        seen = set()
+        node = self
+        while node not in seen:
+            seen.add(node)
+
+            first = next(node.get_objects(RDF_FIRST), None)
+            if first is None:
+                return None
             items.append(first)
-            for rest in self.get_objects(RDF_REST):
-                if rest.term == RDF_NIL:
-                    return items
-                if not isinstance(rest, Something):
-                    return None
-                rlist = rest.as_list()
-                if rlist is None:
-                    return None
-                items += rlist
+
+            rest = next(node.get_objects(RDF_REST), None)
+            if rest is None:
+                return None
+            if rest.term == RDF_NIL:
                 return items
-                break
-            else:
+            if not isinstance(rest, Something):
                 return None
-            break
-        else:
-            return None
+            node = rest
+
+        return None
 
 
 class Referent(Described):
+    __slots__ = ('_predicate_of', '_values_indexed')
+
     term: IRI
 
-    _predicate_of: set[Proposition]  # p index
+    _predicate_of: dict[Proposition, None]  # p index (in insertion order)
+    _values_indexed: bool  # literal objects also kept in the ops index
 
     def __init__(self, model: Model, term: IRI):
         super().__init__(model, term)
-        self._predicate_of = set()
+        self._predicate_of = _NO_INDEX
+        self._values_indexed = False
 
     def predicate_of(self) -> Iterator[Proposition]:
         for proposition in self._predicate_of:
             yield proposition
 
+    def _index_values(self) -> None:
+        pred = self.term
+        for proposition in self._predicate_of:
+            obj = proposition.object
+            if not obj._track_object_of:
+                object_of = obj._object_of
+                if object_of is _NO_INDEX:
+                    object_of = obj._object_of = {}
+
+                object_of.setdefault(pred, {})[proposition.subject] = proposition
+
+        self._values_indexed = True
+
 
 class Proposition(Resource):
+    __slots__ = ('_subject', '_predicate', '_object')
+
     term: Triple
 
-    _subject: Final[Described]
-    _predicate: Final[Referent]
-    _object: Final[Resource]
+    _subject: Described | None
+    _predicate: Referent | None
+    _object: Resource | None
 
     def __init__(self, model: Model, term: Triple):
         super().__init__(model, term)
-        self._subject = self.model.about(self.term.s)
-        self._predicate = cast(Referent, self.model.get(self.term.p))
-        self._object = self.model.get(self.term.o)
+        self._subject = None
+        self._predicate = None
+        self._object = None
 
     @property
     def subject(self) -> Described:
+        if self._subject is None:
+            self._subject = self.model.about(self.term.s)
         return self._subject
 
     @property
     def predicate(self) -> Referent:
+        if self._predicate is None:
+            self._predicate = cast(Referent, self.model.get(self.term.p))
         return self._predicate
 
     @property
     def object(self) -> Resource:
+        if self._object is None:
+            self._object = self.model.get(self.term.o)
         return self._object
 
     def is_fact(self) -> bool:
-        return self._subject.has(self._predicate.term, self._object)
+        s, p, o = self.term
+        subj = self._subject
+        if subj is None:
+            subj = self.model._resources.get(s)  # type: ignore[assignment]
+            if subj is None:
+                return False
+
+        return subj.has(p, o if self._object is None else self._object)
 
 
 class Value(Resource):
+    __slots__ = ()
+
     term: Literal
 
+    # Only indexed per predicate once first looked up (see get_subjects).
+    _track_object_of = False
+
     def __init__(self, model: Model, literal: Literal):
         super().__init__(model, literal)
 
     def __str__(self) -> str:
         return self.term.string
 
+    def get_subjects(self, predicate: IRI) -> Iterator[Described]:
+        prop = self.model._resources.get(predicate)
+        if not isinstance(prop, Referent):
+            return iter(_EMPTY)
+
+        if not prop._values_indexed:
+            prop._index_values()
+
+        return super().get_subjects(predicate)
+
     @property
     def datatype(self) -> Referent:
-        datatype = self.model.about(self.term.datatype)
-        return cast(Referent, datatype)
+        return self.model._resources[self.term.datatype]  # type: ignore[return-value]
 
     @property
     def language(self) -> str | None:
@@ -378,13 +583,43 @@ class Value(Resource):
         return self.term.direction
 
 
-def _get_order_of(term: Term):
-    match term:
-        case IRI(_):
-            return 1
-        case BNode(_):
-            return 2
-        case Literal(_):
-            return 3
-        case Triple(_):
-            return 4
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Bulk loads allocate many long-lived, cyclic objects (resources refer
+    # back to their model), which makes the cyclic collector rescan the
+    # growing heap over and over to no avail. This disables the collector
+    # for the whole process while the input is consumed, which is why it
+    # is left to the caller to opt in.
+    if not gc.isenabled():
+        yield
+        return
+
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+_RESOURCE_BY_TYPE: dict[type, type[Resource]] = {
+    IRI: Referent,
+    BNode: Something,
+    Literal: Value,
+    Triple: Proposition,
+}
+
+_ORDER_BY_TYPE: dict[type, int] = {
+    IRI: 1,
+    BNode: 2,
+    Literal: 3,
+    Triple: 4,
+}
+
+
+def _find_by_type[V](table: dict[type, V], term: Term) -> V:
+    # For subclasses of the term types, which are not in the tables as is.
+    for term_type, value in table.items():
+        if isinstance(term, term_type):
+            return value
+
+    raise TypeError(f"Unsupported term type: {type(term)!r}")
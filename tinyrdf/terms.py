@@ -41,6 +41,20 @@ class Literal(NamedTuple):
         return cls(string, datatype, language, direction)
 
 
+def plain_literal(
+    string: str, language: None = None, direction: None = None
+) -> Literal:
+    return Literal(string, XSD_STRING)
+
+
+def lang_literal(string: str, language: str, direction: None = None) -> Literal:
+    return Literal(string, RDF_LANGSTRING, language)
+
+
+def dirlang_literal(string: str, language: str, direction: Direction) -> Literal:
+    return Literal(string, RDF_DIRLANGSTRING, language, direction)
+
+
 class Triple(NamedTuple):
     s: Subject
     p: IRI
@@ -5,6 +5,10 @@ Decode:
     True
     >>> decode_literal(Literal('false', XSD_BOOLEAN))
     False
+    >>> decode_literal(Literal('1', XSD_BOOLEAN))
+    True
+    >>> decode_literal(Literal('0', XSD_BOOLEAN))
+    False
 
     >>> decode_literal(Literal('0', XSD_INTEGER))
     0
@@ -27,6 +31,17 @@ Decode:
     >>> assert decode_literal(Literal('1970-01-01', XSD_DATE)) == epoch.date()
     >>> assert decode_literal(Literal('00:00:00+00:00', XSD_TIME)) == epoch.timetz()
 
+Decode many lexical values of the same datatype:
+
+    >>> decode_literals(['0', '1', '2'], XSD_INTEGER)
+    [0, 1, 2]
+    >>> decode_literals(['true', '0'], XSD_BOOLEAN)
+    [True, False]
+    >>> decode_literals(['true', 'no'], XSD_BOOLEAN)
+    Traceback (most recent call last):
+      ...
+    ValueError: Unrecognized lexical value: 'no'
+
 Encode:
 
     >>> assert encode_value(True) == Literal('true', XSD_BOOLEAN)
@@ -51,7 +66,9 @@ Encode:
 from __future__ import annotations
 
 from base64 import b64decode, b64encode
+from collections.abc import Callable, Sequence
 from datetime import UTC, date, datetime, time
+from functools import lru_cache
 from typing import NamedTuple
 
 from .terms import (IRI, RDF_DIRLANGSTRING, RDF_LANGSTRING, XSD, XSD_STRING,
@@ -75,6 +92,15 @@ def decode_literal(literal: Literal) -> object:
     return _from_lexical_by_type(literal.string, literal.datatype)
 
 
+def decode_literals(lexicals: Sequence[str], datatype: IRI) -> list[object]:
+    values = list(map(_get_decoder(datatype), lexicals))
+    if None in values:
+        lexical = lexicals[values.index(None)]
+        raise ValueError(f"Unrecognized lexical value: {lexical!r}")
+
+    return values
+
+
 def encode_value(
     value: RecognizedType,
     language: str | None = None,
@@ -90,26 +116,46 @@ def encode_value(
     return Literal(s, dt)  # value=value
 
 
-DECODER_BY_TYPE = {
-    XSD_BOOLEAN: lambda s: s == 'true' if s in ('true', 'false') else None,
-    XSD_INTEGER: lambda s: int(s),
-    XSD_DOUBLE: lambda s: float(s),
-    XSD_STRING: lambda s: str(s),
-    XSD_BASE64BINARY: lambda s: b64decode(s),
-    XSD_DATETIME: lambda s: datetime.fromisoformat(s),
-    XSD_DATETIMESTAMP: lambda s: datetime.fromisoformat(s),  # TODO: assert value.tzinfo
-    XSD_DATE: lambda s: date.fromisoformat(s),
-    XSD_TIME: lambda s: time.fromisoformat(s),
+BOOLEAN_BY_LEXICAL = {'true': True, 'false': False, '1': True, '0': False}
+
+# Unlike the other decoders, b64decode is implemented in Python, so repeated
+# values are cheaper to look up than to decode again. Only short values are
+# cached, to not keep large binary payloads alive.
+_cached_b64decode = lru_cache(maxsize=4096)(b64decode)
+_MAX_CACHED_BASE64_LENGTH = 64
+
+
+def _decode_base64(s: str) -> bytes:
+    if len(s) <= _MAX_CACHED_BASE64_LENGTH:
+        return _cached_b64decode(s)
+
+    return b64decode(s)
+
+
+DECODER_BY_TYPE: dict[IRI, Callable[[str], object]] = {
+    XSD_BOOLEAN: BOOLEAN_BY_LEXICAL.get,
+    XSD_INTEGER: int,
+    XSD_DOUBLE: float,
+    XSD_STRING: str,
+    XSD_BASE64BINARY: _decode_base64,
+    XSD_DATETIME: datetime.fromisoformat,
+    XSD_DATETIMESTAMP: datetime.fromisoformat,  # TODO: assert value.tzinfo
+    XSD_DATE: date.fromisoformat,
+    XSD_TIME: time.fromisoformat,
     # ...
 }
 
 
-def _from_lexical_by_type(lexical: str, datatype: IRI) -> object:
+def _get_decoder(datatype: IRI) -> Callable[[str], object]:
     decoder = DECODER_BY_TYPE.get(datatype)
     if decoder is None:
         raise NotImplementedError
 
-    data = decoder(lexical)
+    return decoder
+
+
+def _from_lexical_by_type(lexical: str, datatype: IRI) -> object:
+    data = _get_decoder(datatype)(lexical)
     if data is None:
         raise ValueError(f"Unrecognized lexical value: {lexical!r}")
 